@@ -18,6 +18,8 @@ from src.types import (
     SearchDocsParams,
     ValidateGraphQLParams,
 )
+from src.utils.http_client import close_client
+from src.utils.instrumentation import flush_usage, start_usage_worker
 
 # Create server instance
 mcp = FastMCP(SERVER_NAME, version=PACKAGE_VERSION)
@@ -27,18 +29,33 @@ _schemas_cache = None
 _apis_cache = None
 _versions_cache = None
 _latest_version_cache = None
+_schemas_lock = asyncio.Lock()
 
+# Background refresh of the schemas cache, in seconds
+SCHEMAS_REFRESH_INTERVAL = 3600
+SCHEMAS_RETRY_INTERVAL = 30
 
-async def get_schemas_data():
-    """Get cached schemas data or fetch if not cached."""
+
+def _store_schemas_data(data: dict) -> None:
+    """Replace the cached schemas data."""
     global _schemas_cache, _apis_cache, _versions_cache, _latest_version_cache
     
-    if _schemas_cache is None:
-        data = await fetch_graphql_schemas()
-        _schemas_cache = data["schemas"]
-        _apis_cache = data["apis"]
-        _versions_cache = data["versions"]
-        _latest_version_cache = data["latest_version"]
+    _schemas_cache = data["schemas"]
+    _apis_cache = data["apis"]
+    _versions_cache = data["versions"]
+    _latest_version_cache = data["latest_version"]
+
+
+async def get_schemas_data():
+    """Get cached schemas data or fetch if not cached."""
+    # Concurrent first calls wait for a single fetch
+    async with _schemas_lock:
+        if _schemas_cache is None:
+            data = await fetch_graphql_schemas()
+            if not data["schemas"]:
+                # A failed fetch is not cached, so the next call retries
+                return data
+            _store_schemas_data(data)
     
     return {
         "schemas": _schemas_cache,
@@ -113,7 +130,7 @@ async def introspect_graphql_schema(
     
     Args:
         conversationId: 🔗 REQUIRED: conversationId from learn_shopify_api tool
-        query: Search term to filter schema elements by name
+        query: Search term to filter schema elements by name; separate multiple terms with commas
         filter: Filter results - valid values are 'types', 'queries', 'mutations', or 'all'
         api: The API to introspect (default: 'admin')
         version: The version of the API to introspect
@@ -214,23 +231,7 @@ async def learn_shopify_api(
 
 
 # Prompts
-@mcp.prompt("shopify_admin_graphql")
-async def shopify_admin_graphql_prompt(query: str) -> list[dict[str, Any]]:
-    """
-    Help write GraphQL operations for the Shopify Admin API.
-    
-    Args:
-        query: The specific Shopify Admin API question or request
-        
-    Returns:
-        Prompt messages for GraphQL operation creation
-    """
-    return [
-        {
-            "role": "user",
-            "content": {
-                "type": "text",
-                "text": f"""I need help writing a GraphQL operation for the Shopify Admin API.
+_GRAPHQL_PROMPT_TEMPLATE = """I need help writing a GraphQL operation for the Shopify Admin API.
 
 Here is my specific request: {query}
 
@@ -248,12 +249,58 @@ When formulating your response, make sure to:
 - Handle error cases appropriately
 - Ensure the query is optimized for performance
 
-The GraphQL operation should be ready to use with minimal modification.""",
+The GraphQL operation should be ready to use with minimal modification."""
+
+
+@mcp.prompt("shopify_admin_graphql")
+async def shopify_admin_graphql_prompt(query: str) -> list[dict[str, Any]]:
+    """
+    Help write GraphQL operations for the Shopify Admin API.
+    
+    Args:
+        query: The specific Shopify Admin API question or request
+        
+    Returns:
+        Prompt messages for GraphQL operation creation
+    """
+    return [
+        {
+            "role": "user",
+            "content": {
+                "type": "text",
+                "text": _GRAPHQL_PROMPT_TEMPLATE.format(query=query),
             },
         }
     ]
 
 
+async def keep_schemas_warm() -> None:
+    """Fill the schemas cache at startup, then refresh it in the background."""
+    await get_schemas_data()
+    
+    while True:
+        # Retry soon while the cache is empty, otherwise refresh periodically
+        interval = SCHEMAS_RETRY_INTERVAL if _schemas_cache is None else SCHEMAS_REFRESH_INTERVAL
+        await asyncio.sleep(interval)
+        
+        data = await fetch_graphql_schemas()
+        if data["schemas"]:
+            async with _schemas_lock:
+                _store_schemas_data(data)
+
+
+async def serve(**transport_kwargs: Any) -> None:
+    """Run the MCP server, warming the schemas cache while the transport starts."""
+    start_usage_worker()
+    warmup = asyncio.create_task(keep_schemas_warm())
+    try:
+        await mcp.run_async(**transport_kwargs)
+    finally:
+        warmup.cancel()
+        await flush_usage()
+        await close_client()
+
+
 def main():
     """Run the MCP server."""
     import sys
@@ -270,11 +317,11 @@ def main():
                 port = int(sys.argv[i + 1])
         
         print(f"Starting HTTP server on port {port}", file=sys.stderr)
-        mcp.run(transport="http", port=port)
+        asyncio.run(serve(transport="http", port=port))
     else:
         # Default stdio mode for MCP clients
         print("Starting in stdio mode for MCP clients", file=sys.stderr)
-        mcp.run()
+        asyncio.run(serve())
 
 
 if __name__ == "__main__":
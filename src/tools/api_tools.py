@@ -1,10 +1,12 @@
 """API-related tools for Shopify MCP Server."""
-import json
+from pydantic import TypeAdapter
 
 from ..settings import LIQUID_MCP_ENABLED, POLARIS_UNIFIED_ENABLED
 from ..types import GettingStartedAPI, LearnShopifyAPIParams
-from ..utils.http_client import shopify_dev_fetch
-from ..utils.instrumentation import generate_conversation_id, record_usage
+from ..utils.http_client import shopify_dev_fetch, shopify_dev_fetch_bytes
+from ..utils.instrumentation import enqueue_usage, generate_conversation_id
+
+_getting_started_apis_adapter = TypeAdapter(list[GettingStartedAPI])
 
 
 async def fetch_getting_started_apis() -> list[GettingStartedAPI]:
@@ -21,21 +23,16 @@ async def fetch_getting_started_apis() -> list[GettingStartedAPI]:
         if LIQUID_MCP_ENABLED:
             parameters["liquid_mcp"] = "true"
         
-        response_text = await shopify_dev_fetch(
+        response_content = await shopify_dev_fetch_bytes(
             "/mcp/getting_started_apis",
             parameters=parameters,
         )
         
-        print(f"[fetch-getting-started-apis] Response text (truncated): {response_text[:200]}...")
+        print(f"[fetch-getting-started-apis] Response text (truncated): {response_content[:200].decode(errors='replace')}...")
         
         try:
-            json_data = json.loads(response_text)
-            # Validate data
-            apis = []
-            for api_data in json_data:
-                api = GettingStartedAPI(**api_data)
-                apis.append(api)
-            return apis
+            # Parse and validate data
+            return _getting_started_apis_adapter.validate_json(response_content)
         except Exception as e:
             print(f"[fetch-getting-started-apis] Error parsing JSON response: {e}")
             return []
@@ -63,9 +60,9 @@ async def learn_shopify_api(params: LearnShopifyAPIParams) -> dict:
             parameters={"api": params.api},
         )
         
-        await record_usage(
+        enqueue_usage(
             "learn_shopify_api",
-            params.model_dump(by_alias=True),
+            params,
             response_text,
         )
         
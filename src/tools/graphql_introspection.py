@@ -1,15 +1,91 @@
 """GraphQL introspection tools for Shopify MCP Server."""
-import json
+import asyncio
+import heapq
+import pickle
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
+
+import ijson
 
 from ..settings import SCHEMAS_CACHE_DIR
 from ..types import IntrospectGraphQLParams, Schema
-from ..utils.http_client import shopify_dev_fetch
-from ..utils.instrumentation import record_usage
+from ..utils import json_codec
+from ..utils.file_cache import write_atomic, write_pickle
+from ..utils.http_client import shopify_dev_fetch_bytes
+from ..utils.instrumentation import enqueue_usage
 
 # Constants
 MAX_FIELDS_TO_SHOW = 50
 MAX_RESULTS = 10
+TYPE_DESCRIPTION_LENGTH = 150
+OPERATION_DESCRIPTION_LENGTH = 100
+THREADED_FILTER_THRESHOLD = 1000
+RESULT_CACHE_SIZE = 256
+
+
+@dataclass(slots=True)
+class SchemaField:
+    """Field of a schema type, with its display strings pre-formatted."""
+    name: str
+    name_lower: str
+    formatted: str
+    type_formatted: str
+    args_formatted: list[str]
+    description_short: str | None = None
+
+
+@dataclass(slots=True)
+class SchemaType:
+    """Schema type trimmed down to what introspection results show."""
+    name: str
+    name_lower: str
+    kind: str
+    description_short: str | None
+    fields: list[SchemaField]
+    input_fields: list[SchemaField]
+    interface_names: list[str]
+
+
+@dataclass(slots=True)
+class NameIndex:
+    """
+    Searchable collection of schema items stored as parallel columns.
+    
+    Filtering walks the contiguous names_lower list and only dereferences
+    items for the final matches.
+    """
+    names_lower: list[str]
+    lengths: list[int]
+    items: list[SchemaType] | list[SchemaField]
+    
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+@dataclass(slots=True)
+class SchemaIndex:
+    """Slim schema with search entries for types, queries, and mutations."""
+    types: NameIndex
+    queries: NameIndex
+    mutations: NameIndex
+
+
+_EMPTY_INDEX = NameIndex(names_lower=[], lengths=[], items=[])
+
+# Per-schema locks so concurrent first calls download the schema once
+_schema_download_locks: dict[str, asyncio.Lock] = {}
+
+# Schema search indexes, keyed by schema id
+_schema_index_cache: dict[str, SchemaIndex] = {}
+
+# In-flight index builds, so concurrent first calls share one build
+_schema_index_builds: dict[str, asyncio.Task] = {}
+
+# Recent introspection responses, keyed by (schema id, normalized query, filter)
+_result_cache: OrderedDict[tuple[str, str, frozenset[str]], str] = OrderedDict()
 
 
 async def get_schema(api: str, version: str, schemas: list[Schema]) -> Schema:
@@ -29,37 +105,224 @@ async def get_schema(api: str, version: str, schemas: list[Schema]) -> Schema:
     )
 
 
-async def load_schema_content(schema: Schema) -> str:
-    """Load schema content from cache or API."""
+async def ensure_schema_file(schema: Schema) -> Path:
+    """Download the schema JSON into the cache directory if it is missing."""
     # Ensure cache directory exists
     SCHEMAS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
     
     cache_file_path = SCHEMAS_CACHE_DIR / f"{schema.id}.json"
     
+    # Check if we have a cached version
+    if cache_file_path.exists():
+        return cache_file_path
+    
+    lock = _schema_download_locks.setdefault(schema.id, asyncio.Lock())
     try:
-        # Check if we have a cached version
-        if cache_file_path.exists():
-            print(f"[introspect-graphql-schema] Reading cached schema from {cache_file_path}")
-            return cache_file_path.read_text()
-        
-        print(f"[introspect-graphql-schema] Fetching schema from API for {schema.id}")
-        
-        schema_content = await shopify_dev_fetch(
-            schema.url,
-            headers={"Accept-Encoding": "gzip"},
-        )
-        
-        # Cache the schema content
-        cache_file_path.write_text(schema_content)
-        print(f"[introspect-graphql-schema] Cached schema to {cache_file_path}")
-        
-        return schema_content
+        async with lock:
+            # Another caller may have finished the download while we waited
+            if cache_file_path.exists():
+                return cache_file_path
+            
+            print(f"[introspect-graphql-schema] Fetching schema from API for {schema.id}")
+            
+            schema_content = await shopify_dev_fetch_bytes(
+                schema.url,
+                headers={"Accept-Encoding": "gzip"},
+            )
+            
+            # Cache the schema content; readers never see a partial file
+            await asyncio.to_thread(write_atomic, cache_file_path, lambda f: f.write(schema_content))
+            print(f"[introspect-graphql-schema] Cached schema to {cache_file_path}")
+            
+            return cache_file_path
         
     except Exception as error:
         print(f"[introspect-graphql-schema] Error loading schema: {error}")
         raise
 
 
+def _read_schema_bytes(path: Path) -> bytes:
+    """Read a cached schema file."""
+    print(f"[introspect-graphql-schema] Reading cached schema from {path}")
+    return path.read_bytes()
+
+
+async def load_schema_content(schema: Schema) -> bytes:
+    """
+    Load raw schema JSON bytes from cache or API.
+    
+    The file is read on demand in a worker thread and not kept in memory;
+    callers only need the raw bytes once per process.
+    
+    Args:
+        schema: Schema to load
+        
+    Returns:
+        Raw schema JSON bytes
+    """
+    cache_file_path = await ensure_schema_file(schema)
+    return await asyncio.to_thread(_read_schema_bytes, cache_file_path)
+
+
+def _read_pickle(path: Path) -> object:
+    """Load a pickled object from path."""
+    with path.open("rb") as f:
+        return pickle.load(f)
+
+
+async def load_schema_json(schema: Schema) -> dict:
+    """
+    Load the parsed schema JSON, caching it as a pickle on disk.
+    
+    Callers keep whatever they derive from it, so the parsed document is
+    not held in memory here. Disk reads, parsing and the pickle write run
+    in worker threads.
+    
+    Args:
+        schema: Schema to load
+        
+    Returns:
+        Parsed introspection result
+    """
+    pickle_path = SCHEMAS_CACHE_DIR / f"{schema.id}.pkl"
+    
+    if pickle_path.exists():
+        try:
+            parsed = await asyncio.to_thread(_read_pickle, pickle_path)
+            print(f"[introspect-graphql-schema] Read parsed schema from {pickle_path}")
+            return parsed
+        except Exception as error:
+            print(f"[introspect-graphql-schema] Ignoring unreadable schema pickle: {error}")
+    
+    parsed = await asyncio.to_thread(json_codec.loads, await load_schema_content(schema))
+    try:
+        await asyncio.to_thread(write_pickle, pickle_path, parsed)
+    except Exception as error:
+        print(f"[introspect-graphql-schema] Error caching parsed schema: {error}")
+    
+    return parsed
+
+
+def shorten_description(description: str, max_length: int) -> str:
+    """Flatten a description to one line and truncate it to max_length."""
+    desc = description.replace("\n", " ")
+    if len(desc) > max_length:
+        desc = desc[:max_length] + "..."
+    return desc
+
+
+def _slim_field(field: dict) -> SchemaField:
+    """Keep only the field data used when formatting introspection results."""
+    description = field.get("description")
+    return SchemaField(
+        name=field["name"],
+        name_lower=field["name"].lower(),
+        formatted=format_field(field),
+        type_formatted=format_type(field["type"]),
+        args_formatted=[format_arg(arg) for arg in field.get("args") or []],
+        description_short=(
+            shorten_description(description, OPERATION_DESCRIPTION_LENGTH)
+            if description else None
+        ),
+    )
+
+
+def _slim_type(type_obj: dict) -> SchemaType:
+    """
+    Keep only the type data used when formatting introspection results.
+    
+    Enum values, possible types, and argument descriptions are dropped and
+    the remaining descriptions are pre-truncated, since the rest is never shown.
+    """
+    description = type_obj.get("description")
+    return SchemaType(
+        name=type_obj["name"],
+        name_lower=type_obj["name"].lower(),
+        kind=type_obj["kind"],
+        description_short=(
+            shorten_description(description, TYPE_DESCRIPTION_LENGTH)
+            if description else None
+        ),
+        fields=[_slim_field(f) for f in type_obj.get("fields") or []],
+        input_fields=[_slim_field(f) for f in type_obj.get("inputFields") or []],
+        interface_names=[i["name"] for i in type_obj.get("interfaces") or []],
+    )
+
+
+def _iter_schema_types(path: Path) -> Iterator[dict]:
+    """Stream the types out of a cached introspection JSON file."""
+    with path.open("rb") as f:
+        yield from ijson.items(f, "data.__schema.types.item")
+
+
+def _index_items(items: list[SchemaType] | list[SchemaField]) -> NameIndex:
+    """Build the name columns for a collection of schema items."""
+    return NameIndex(
+        names_lower=[item.name_lower for item in items],
+        lengths=[len(item.name) for item in items],
+        items=items,
+    )
+
+
+def _build_schema_index(path: Path) -> SchemaIndex:
+    """Build the search index from a cached introspection JSON file."""
+    types = [_slim_type(t) for t in _iter_schema_types(path)]
+    
+    # Find Query and Mutation types
+    query_root_fields: list[SchemaField] = []
+    mutation_fields: list[SchemaField] = []
+    for schema_type in types:
+        if schema_type.name == "QueryRoot":
+            query_root_fields = schema_type.fields
+        elif schema_type.name == "Mutation":
+            mutation_fields = schema_type.fields
+    
+    return SchemaIndex(
+        types=_index_items(types),
+        queries=_index_items(query_root_fields),
+        mutations=_index_items(mutation_fields),
+    )
+
+
+async def _build_schema_index_for(schema: Schema) -> SchemaIndex:
+    """Download the schema if needed and build its index in a worker thread."""
+    cache_file_path = await ensure_schema_file(schema)
+    return await asyncio.to_thread(_build_schema_index, cache_file_path)
+
+
+async def load_schema_index(schema: Schema) -> SchemaIndex:
+    """
+    Load the search index for a schema's types, queries, and mutations.
+    
+    The index is streamed from the cached schema file, so the full
+    introspection document is never held in memory for introspection.
+    
+    Args:
+        schema: Schema to index
+        
+    Returns:
+        Search index for the schema
+    """
+    cached = _schema_index_cache.get(schema.id)
+    if cached is not None:
+        return cached
+    
+    build = _schema_index_builds.get(schema.id)
+    if build is None:
+        build = asyncio.create_task(_build_schema_index_for(schema))
+        _schema_index_builds[schema.id] = build
+    
+    try:
+        # Shield the shared build from cancellation of a single waiter
+        index = await asyncio.shield(build)
+    finally:
+        if build.done():
+            _schema_index_builds.pop(schema.id, None)
+    
+    _schema_index_cache[schema.id] = index
+    return index
+
+
 def format_type(type_obj: dict) -> str:
     """Format GraphQL type as string."""
     if not type_obj:
@@ -75,106 +338,206 @@ def format_type(type_obj: dict) -> str:
 
 def format_arg(arg: dict) -> str:
     """Format GraphQL argument."""
-    result = f"{arg['name']}: {format_type(arg['type'])}"
     if arg.get("defaultValue") is not None:
-        result += f" = {arg['defaultValue']}"
-    return result
+        return f"{arg['name']}: {format_type(arg['type'])} = {arg['defaultValue']}"
+    return f"{arg['name']}: {format_type(arg['type'])}"
 
 
 def format_field(field: dict) -> str:
     """Format GraphQL field."""
-    result = f"  {field['name']}"
+    parts = [f"  {field['name']}"]
     
     # Add arguments if present
     if field.get("args"):
-        result += f"({', '.join(format_arg(arg) for arg in field['args'])})"
+        parts.append(f"({', '.join(format_arg(arg) for arg in field['args'])})")
     
-    result += f": {format_type(field['type'])}"
+    parts.append(f": {format_type(field['type'])}")
     
     # Add deprecation info if present
     if field.get("isDeprecated"):
-        result += " @deprecated"
+        parts.append(" @deprecated")
         if field.get("deprecationReason"):
-            result += f" ({field['deprecationReason']})"
+            parts.append(f" ({field['deprecationReason']})")
     
-    return result
+    return "".join(parts)
 
 
-def format_schema_type(item: dict) -> str:
+def format_schema_type(item: SchemaType) -> str:
     """Format GraphQL schema type."""
-    result = f"{item['kind']} {item['name']}"
+    lines = [f"{item.kind} {item.name}"]
     
-    if item.get("description"):
-        # Truncate description if too long
-        desc = item["description"].replace("\n", " ")
-        if len(desc) > 150:
-            desc = desc[:150] + "..."
-        result += f"\n  Description: {desc}"
+    if item.description_short:
+        lines.append(f"  Description: {item.description_short}")
     
     # Add interfaces if present
-    if item.get("interfaces"):
-        result += f"\n  Implements: {', '.join(i['name'] for i in item['interfaces'])}"
+    if item.interface_names:
+        lines.append(f"  Implements: {', '.join(item.interface_names)}")
     
     # For INPUT_OBJECT types, use inputFields instead of fields
-    if item["kind"] == "INPUT_OBJECT" and item.get("inputFields"):
-        result += "\n  Input Fields:"
-        fields_to_show = item["inputFields"][:MAX_FIELDS_TO_SHOW]
-        for field in fields_to_show:
-            result += f"\n{format_field(field)}"
-        if len(item["inputFields"]) > MAX_FIELDS_TO_SHOW:
-            result += f"\n  ... and {len(item['inputFields']) - MAX_FIELDS_TO_SHOW} more input fields"
+    if item.kind == "INPUT_OBJECT" and item.input_fields:
+        lines.append("  Input Fields:")
+        fields_to_show = item.input_fields[:MAX_FIELDS_TO_SHOW]
+        lines.extend(field.formatted for field in fields_to_show)
+        if len(item.input_fields) > MAX_FIELDS_TO_SHOW:
+            lines.append(f"  ... and {len(item.input_fields) - MAX_FIELDS_TO_SHOW} more input fields")
     # For regular object types, use fields
-    elif item.get("fields"):
-        result += "\n  Fields:"
-        fields_to_show = item["fields"][:MAX_FIELDS_TO_SHOW]
-        for field in fields_to_show:
-            result += f"\n{format_field(field)}"
-        if len(item["fields"]) > MAX_FIELDS_TO_SHOW:
-            result += f"\n  ... and {len(item['fields']) - MAX_FIELDS_TO_SHOW} more fields"
+    elif item.fields:
+        lines.append("  Fields:")
+        fields_to_show = item.fields[:MAX_FIELDS_TO_SHOW]
+        lines.extend(field.formatted for field in fields_to_show)
+        if len(item.fields) > MAX_FIELDS_TO_SHOW:
+            lines.append(f"  ... and {len(item.fields) - MAX_FIELDS_TO_SHOW} more fields")
     
-    return result
+    return "\n".join(lines)
 
 
-def format_graphql_operation(query: dict) -> str:
+def format_graphql_operation(query: SchemaField) -> str:
     """Format GraphQL operation (query/mutation)."""
-    result = f"{query['name']}"
+    lines = [query.name]
     
-    if query.get("description"):
-        desc = query["description"].replace("\n", " ")
-        if len(desc) > 100:
-            desc = desc[:100] + "..."
-        result += f"\n  Description: {desc}"
+    if query.description_short:
+        lines.append(f"  Description: {query.description_short}")
     
     # Add arguments if present
-    if query.get("args"):
-        result += "\n  Arguments:"
-        for arg in query["args"]:
-            result += f"\n    {format_arg(arg)}"
+    if query.args_formatted:
+        lines.append("  Arguments:")
+        lines.extend(f"    {arg}" for arg in query.args_formatted)
     
     # Add return type
-    result += f"\n  Returns: {format_type(query['type'])}"
+    lines.append(f"  Returns: {query.type_formatted}")
     
-    return result
+    return "\n".join(lines)
 
 
-def filter_and_sort_items(items: list, search_term: str, max_items: int) -> dict:
-    """Filter, sort, and truncate schema items."""
-    # Filter items based on search term
-    filtered = [
-        item for item in items
-        if search_term in item.get("name", "").lower()
-    ]
+def normalize_search_term(term: str) -> str:
+    """Normalize a search term by dropping a trailing "s" and spaces, lowercased."""
+    return term.strip().removesuffix("s").replace(" ", "").lower()
+
+
+def compile_search_terms(terms: list[str]) -> str | re.Pattern[str]:
+    """
+    Compile normalized search terms into a matcher for filter_and_sort_items.
     
-    # Sort filtered items by name length (shorter names first)
-    filtered.sort(key=lambda x: len(x.get("name", "")))
+    A single term is returned as-is so matching can use a plain substring
+    check; multiple terms are OR'd into one precompiled regex.
+    """
+    if len(terms) == 1:
+        return terms[0]
+    return re.compile("|".join(re.escape(term) for term in terms))
+
+
+def filter_and_sort_items(
+    indexed: NameIndex,
+    matcher: str | re.Pattern[str],
+    max_items: int,
+) -> dict:
+    """Filter, sort, and truncate indexed schema items."""
+    # Filter item positions based on search term(s)
+    if isinstance(matcher, str):
+        matches = [i for i, name in enumerate(indexed.names_lower) if matcher in name]
+    else:
+        search = matcher.search
+        matches = [i for i, name in enumerate(indexed.names_lower) if search(name)]
+    
+    # Keep the shortest names without sorting every match
+    shortest = heapq.nsmallest(max_items, matches, key=indexed.lengths.__getitem__)
     
     # Return truncation info and limited items
     return {
-        "was_truncated": len(filtered) > max_items,
-        "items": filtered[:max_items],
+        "was_truncated": len(matches) > max_items,
+        "items": [indexed.items[i] for i in shortest],
     }
 
 
+async def filter_collection(
+    indexed: NameIndex,
+    matcher: str | re.Pattern[str],
+    max_items: int,
+) -> dict:
+    """Run filter_and_sort_items, off the event loop for large collections."""
+    if len(indexed) > THREADED_FILTER_THRESHOLD:
+        return await asyncio.to_thread(filter_and_sort_items, indexed, matcher, max_items)
+    return filter_and_sort_items(indexed, matcher, max_items)
+
+
+async def search_schema_index(
+    index: SchemaIndex,
+    normalized_terms: list[str],
+    sections_filter: frozenset[str],
+) -> str:
+    """
+    Search a schema index and format the matching sections.
+    
+    Args:
+        index: Schema search index
+        normalized_terms: Normalized search terms
+        sections_filter: Requested sections ("all", "types", "queries", "mutations")
+        
+    Returns:
+        Formatted search results
+    """
+    matcher = compile_search_terms(normalized_terms)
+    
+    # Resolve the requested sections once
+    want_all = "all" in sections_filter
+    want_types = want_all or "types" in sections_filter
+    want_queries = want_all or "queries" in sections_filter
+    want_mutations = want_all or "mutations" in sections_filter
+    
+    # Filter types, queries, and mutations concurrently
+    types_result, queries_result, mutations_result = await asyncio.gather(
+        filter_collection(index.types if want_types else _EMPTY_INDEX, matcher, MAX_RESULTS),
+        filter_collection(index.queries if want_queries else _EMPTY_INDEX, matcher, MAX_RESULTS),
+        filter_collection(index.mutations if want_mutations else _EMPTY_INDEX, matcher, MAX_RESULTS),
+    )
+    matching_queries = queries_result["items"]
+    matching_mutations = mutations_result["items"]
+    
+    # Build response text
+    sections: list[str] = []
+    if want_types:
+        sections.append("## Matching GraphQL Types:\n")
+        if types_result["was_truncated"]:
+            sections.append("(Results limited to 10 items. Refine your search for more specific results.)\n\n")
+        
+        if types_result["items"]:
+            sections.append("\n\n".join(
+                format_schema_type(t) for t in types_result["items"]
+            ))
+            sections.append("\n\n")
+        else:
+            sections.append("No matching types found.\n\n")
+    
+    # Add queries section
+    if want_queries:
+        sections.append("## Matching GraphQL Queries:\n")
+        if len(matching_queries) == MAX_RESULTS:
+            sections.append("(Results limited to 10 items. Refine your search for more specific results.)\n\n")
+        
+        if matching_queries:
+            sections.append("\n\n".join(
+                format_graphql_operation(q) for q in matching_queries
+            ))
+            sections.append("\n\n")
+        else:
+            sections.append("No matching queries found.\n\n")
+    
+    # Add mutations section
+    if want_mutations:
+        sections.append("## Matching GraphQL Mutations:\n")
+        if len(matching_mutations) == MAX_RESULTS:
+            sections.append("(Results limited to 10 items. Refine your search for more specific results.)\n\n")
+        
+        if matching_mutations:
+            sections.append("\n\n".join(
+                format_graphql_operation(m) for m in matching_mutations
+            ))
+        else:
+            sections.append("No matching mutations found.")
+    
+    return "".join(sections)
+
+
 async def introspect_graphql_schema(
     params: IntrospectGraphQLParams,
     schemas: list[Schema],
@@ -193,104 +556,40 @@ async def introspect_graphql_schema(
         # Get the schema based on API and version
         schema = await get_schema(params.api, params.version, schemas)
         
-        # Load the schema content
-        schema_content = await load_schema_content(schema)
-        
-        # Parse the schema content
-        schema_json = json.loads(schema_content)
+        # Normalize comma-separated search terms, dropping any that end up empty
+        normalized_terms = [
+            normalized
+            for normalized in map(normalize_search_term, params.query.split(","))
+            if normalized
+        ]
         
         # If a query is provided, filter the schema
-        response_text = ""
-        
-        if params.query.strip():
-            # Normalize search term
-            normalized_query = params.query.strip()
-            if normalized_query.endswith("s"):
-                normalized_query = normalized_query[:-1]
-            normalized_query = normalized_query.replace(" ", "")
-            
-            print(f"[introspect-graphql-schema] Filtering schema with query: {params.query} (normalized: {normalized_query})")
-            
-            search_term = normalized_query.lower()
-            
-            # Process types
-            types_result = {"was_truncated": False, "items": []}
-            matching_queries = []
-            matching_mutations = []
+        if normalized_terms:
+            normalized_query = ",".join(normalized_terms)
+            sections_filter = frozenset(params.filter)
             
-            if schema_json.get("data", {}).get("__schema", {}).get("types"):
-                types = schema_json["data"]["__schema"]["types"]
+            # Reuse the response for repeated searches
+            cache_key = (schema.id, normalized_query, sections_filter)
+            response_text = _result_cache.get(cache_key)
+            if response_text is not None:
+                _result_cache.move_to_end(cache_key)
+            else:
+                print(f"[introspect-graphql-schema] Filtering schema with query: {params.query} (normalized: {normalized_query})")
                 
-                # Process types
-                types_result = filter_and_sort_items(types, search_term, MAX_RESULTS)
-                
-                # Find Query and Mutation types
-                query_type = next((t for t in types if t["name"] == "QueryRoot"), None)
-                mutation_type = next((t for t in types if t["name"] == "Mutation"), None)
-                
-                # Process queries if available
-                if query_type and query_type.get("fields") and (
-                    "all" in params.filter or "queries" in params.filter
-                ):
-                    queries_result = filter_and_sort_items(
-                        query_type["fields"], search_term, MAX_RESULTS
-                    )
-                    matching_queries = queries_result["items"]
-                
-                # Process mutations if available
-                if mutation_type and mutation_type.get("fields") and (
-                    "all" in params.filter or "mutations" in params.filter
-                ):
-                    mutations_result = filter_and_sort_items(
-                        mutation_type["fields"], search_term, MAX_RESULTS
-                    )
-                    matching_mutations = mutations_result["items"]
-            
-            # Build response text
-            if "all" in params.filter or "types" in params.filter:
-                response_text += "## Matching GraphQL Types:\n"
-                if types_result["was_truncated"]:
-                    response_text += "(Results limited to 10 items. Refine your search for more specific results.)\n\n"
-                
-                if types_result["items"]:
-                    response_text += "\n\n".join(
-                        format_schema_type(t) for t in types_result["items"]
-                    ) + "\n\n"
-                else:
-                    response_text += "No matching types found.\n\n"
-            
-            # Add queries section
-            if "all" in params.filter or "queries" in params.filter:
-                response_text += "## Matching GraphQL Queries:\n"
-                if len(matching_queries) == MAX_RESULTS:
-                    response_text += "(Results limited to 10 items. Refine your search for more specific results.)\n\n"
-                
-                if matching_queries:
-                    response_text += "\n\n".join(
-                        format_graphql_operation(q) for q in matching_queries
-                    ) + "\n\n"
-                else:
-                    response_text += "No matching queries found.\n\n"
-            
-            # Add mutations section
-            if "all" in params.filter or "mutations" in params.filter:
-                response_text += "## Matching GraphQL Mutations:\n"
-                if len(matching_mutations) == MAX_RESULTS:
-                    response_text += "(Results limited to 10 items. Refine your search for more specific results.)\n\n"
+                # Load the schema search index
+                index = await load_schema_index(schema)
+                response_text = await search_schema_index(index, normalized_terms, sections_filter)
                 
-                if matching_mutations:
-                    response_text += "\n\n".join(
-                        format_graphql_operation(m) for m in matching_mutations
-                    )
-                else:
-                    response_text += "No matching mutations found."
+                _result_cache[cache_key] = response_text
+                if len(_result_cache) > RESULT_CACHE_SIZE:
+                    _result_cache.popitem(last=False)
         
         else:
             response_text = "Please provide a search query to filter schema elements."
         
-        await record_usage(
+        enqueue_usage(
             "introspect_graphql_schema",
-            params.model_dump(by_alias=True),
+            params,
             response_text,
         )
         
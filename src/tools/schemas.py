@@ -1,8 +1,11 @@
 """Schema management tools for Shopify MCP Server."""
-import json
+from pydantic import TypeAdapter
 
 from ..types import API, GraphQLSchemasResponse, Schema
-from ..utils.http_client import shopify_dev_fetch
+from ..utils.http_client import shopify_dev_fetch_bytes
+
+_schemas_adapter = TypeAdapter(list[Schema])
+_apis_adapter = TypeAdapter(list[API])
 
 
 async def fetch_graphql_schemas() -> dict:
@@ -13,14 +16,13 @@ async def fetch_graphql_schemas() -> dict:
         Dict containing schemas, apis, versions, and latestVersion
     """
     try:
-        response_text = await shopify_dev_fetch("/mcp/graphql_schemas")
+        response_content = await shopify_dev_fetch_bytes("/mcp/graphql_schemas")
         
         try:
-            json_data = json.loads(response_text)
-            parsed_response = GraphQLSchemasResponse(**json_data)
+            parsed_response = GraphQLSchemasResponse.model_validate_json(response_content)
         except Exception as parse_error:
             print(f"Error parsing schemas JSON: {parse_error}")
-            print(f"Response text: {response_text[:500]}...")
+            print(f"Response text: {response_content[:500].decode(errors='replace')}...")
             return {
                 "schemas": [],
                 "apis": [],
@@ -49,8 +51,8 @@ async def fetch_graphql_schemas() -> dict:
                 })
         
         return {
-            "schemas": [Schema(**s) for s in schemas],
-            "apis": [API(**api_data) for api_data in apis_map.values()],
+            "schemas": _schemas_adapter.validate_python(schemas),
+            "apis": _apis_adapter.validate_python(list(apis_map.values())),
             "versions": sorted(list(versions)),
             "latest_version": parsed_response.latest_version,
         }
@@ -1,10 +1,21 @@
 """Search-related tools for Shopify MCP Server."""
-import json
+import asyncio
+import time
+from collections import OrderedDict
 
 from ..settings import LIQUID_MCP_ENABLED, POLARIS_UNIFIED_ENABLED
 from ..types import FetchDocsParams, SearchDocsParams
-from ..utils.http_client import shopify_dev_fetch
-from ..utils.instrumentation import record_usage
+from ..utils import json_codec
+from ..utils.http_client import shopify_dev_fetch, shopify_dev_fetch_bytes
+from ..utils.instrumentation import enqueue_usage
+
+# Full docs fetching
+MAX_CONCURRENT_DOC_FETCHES = 8
+DOC_CACHE_TTL = 300  # seconds
+DOC_CACHE_SIZE = 64
+
+# Successfully fetched docs as (fetched_at, text), keyed by path, in LRU order
+_doc_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
 
 
 async def search_docs_chunks(params: SearchDocsParams) -> dict:
@@ -26,7 +37,7 @@ async def search_docs_chunks(params: SearchDocsParams) -> dict:
         parameters["polaris_unified"] = "true"
     
     try:
-        response_text = await shopify_dev_fetch(
+        response_content = await shopify_dev_fetch_bytes(
             "/mcp/search",
             parameters={
                 "query": params.prompt,
@@ -34,17 +45,17 @@ async def search_docs_chunks(params: SearchDocsParams) -> dict:
             },
         )
         
-        print(f"[search-shopify-docs] Response text (truncated): {response_text[:200]}...")
+        print(f"[search-shopify-docs] Response text (truncated): {response_content[:200].decode(errors='replace')}...")
         
         # Try to parse as JSON, otherwise return raw text
         try:
-            json_data = json.loads(response_text)
-            formatted_text = json.dumps(json_data, indent=2)
-        except json.JSONDecodeError as e:
+            json_data = json_codec.loads(response_content)
+            formatted_text = json_codec.dumps_pretty(json_data)
+        except (json_codec.JSONDecodeError, UnicodeDecodeError) as e:
             print(f"[search-shopify-docs] Error parsing JSON response: {e}")
-            formatted_text = response_text
+            formatted_text = response_content.decode(errors="replace")
         
-        await record_usage("search_docs_chunks", params.model_dump(by_alias=True), formatted_text)
+        enqueue_usage("search_docs_chunks", params, formatted_text)
         
         return {
             "content": [{
@@ -77,10 +88,26 @@ async def fetch_full_docs(params: FetchDocsParams) -> dict:
     Returns:
         Documentation content
     """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOC_FETCHES)
+    
     async def fetch_doc_text(path: str) -> dict:
         try:
-            appended_path = path if path.endswith(".txt") else f"{path}.txt"
-            response_text = await shopify_dev_fetch(appended_path)
+            cached = _doc_cache.get(path)
+            if cached and time.monotonic() - cached[0] >= DOC_CACHE_TTL:
+                del _doc_cache[path]
+                cached = None
+            
+            if cached:
+                _doc_cache.move_to_end(path)
+                response_text = cached[1]
+            else:
+                appended_path = path if path.endswith(".txt") else f"{path}.txt"
+                async with semaphore:
+                    response_text = await shopify_dev_fetch(appended_path)
+                _doc_cache[path] = (time.monotonic(), response_text)
+                _doc_cache.move_to_end(path)
+                if len(_doc_cache) > DOC_CACHE_SIZE:
+                    _doc_cache.popitem(last=False)
             return {
                 "text": f"## {path}\n\n{response_text}\n\n",
                 "path": path,
@@ -94,15 +121,17 @@ async def fetch_full_docs(params: FetchDocsParams) -> dict:
                 "success": False,
             }
     
-    # Fetch all documents in parallel
-    import asyncio
-    results = await asyncio.gather(*[fetch_doc_text(path) for path in params.paths])
+    # Fetch each unique document once, in parallel
+    unique_paths = list(dict.fromkeys(params.paths))
+    unique_results = await asyncio.gather(*[fetch_doc_text(path) for path in unique_paths])
+    results_by_path = dict(zip(unique_paths, unique_results))
+    results = [results_by_path[path] for path in params.paths]
     
     combined_text = "---\n\n".join(result["text"] for result in results)
     
-    await record_usage(
+    enqueue_usage(
         "fetch_full_docs",
-        params.model_dump(by_alias=True),
+        params,
         combined_text,
     )
     
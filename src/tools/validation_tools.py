@@ -1,13 +1,58 @@
 """Validation tools for Shopify MCP Server."""
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator
+
 from ..types import ValidateGraphQLParams, ValidationResponse, ValidationResult
-from ..utils.instrumentation import record_usage
+from ..utils.instrumentation import enqueue_usage
 from ..validations import has_failed_validation
-from ..validations.graphql_schema import validate_graphql_operation
+from ..validations.graphql_schema import check_empty_operation, resolve_schema, validate_against
+
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
+
+# Dedicated pool for GraphQL parse/validate work
+_VALIDATE_POOL = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 4),
+    thread_name_prefix="graphql-validate",
+)
+
+# Upper bound on code blocks queued for validation at once
+MAX_CONCURRENT_VALIDATIONS = 16
+_VALIDATION_SEM = asyncio.Semaphore(MAX_CONCURRENT_VALIDATIONS)
+
+
+def _iter_validation_lines(
+    results: list[ValidationResponse],
+    item_name: str,
+    failed: bool,
+) -> Iterator[str]:
+    """Yield the markdown summary of validation results piece by piece."""
+    yield "## Validation Summary\n\n"
+    yield f"**Overall Status:** {'❌ INVALID' if failed else '✅ VALID'}\n"
+    yield f"**Total {item_name}:** {len(results)}\n\n"
+    
+    yield "## Detailed Results\n\n"
+    
+    # Bind the per-item constants to locals for the loop
+    item_singular = item_name[:-1]
+    success = ValidationResult.SUCCESS
+    success_status = f"✅ {success.value.upper()}"
+    failed_status = f"❌ {ValidationResult.FAILED.value.upper()}"
+    for index, check in enumerate(results, 1):
+        status = success_status if check.result is success else failed_status
+        yield (
+            f"### {item_singular} {index}\n"
+            f"**Status:** {status}\n"
+            f"**Details:** {check.result_detail}\n\n"
+        )
 
 
 def format_validation_result(
     results: list[ValidationResponse],
     item_name: str = "Items",
+    failed: bool | None = None,
 ) -> str:
     """
     Format validation results into readable markdown.
@@ -15,22 +60,22 @@ def format_validation_result(
     Args:
         results: List of validation responses
         item_name: Name of items being validated
+        failed: Whether any result failed, if the caller already knows
         
     Returns:
         Formatted markdown string
     """
-    response_text = "## Validation Summary\n\n"
-    response_text += f"**Overall Status:** {'✅ VALID' if not has_failed_validation(results) else '❌ INVALID'}\n"
-    response_text += f"**Total {item_name}:** {len(results)}\n\n"
-    
-    response_text += "## Detailed Results\n\n"
-    for index, check in enumerate(results):
-        status_icon = "✅" if check.result == ValidationResult.SUCCESS else "❌"
-        response_text += f"### {item_name[:-1]} {index + 1}\n"
-        response_text += f"**Status:** {status_icon} {check.result.value.upper()}\n"
-        response_text += f"**Details:** {check.result_detail}\n\n"
+    if failed is None:
+        failed = has_failed_validation(results)
     
-    return response_text
+    return "".join(_iter_validation_lines(results, item_name, failed))
+
+
+async def _validate_bounded(schema: "GraphQLSchema", codeblock: str) -> ValidationResponse:
+    """Validate one code block on the validation pool, bounded by _VALIDATION_SEM."""
+    async with _VALIDATION_SEM:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_VALIDATE_POOL, validate_against, schema, codeblock)
 
 
 async def validate_graphql_codeblocks(
@@ -47,28 +92,57 @@ async def validate_graphql_codeblocks(
     Returns:
         Validation results
     """
-    # Validate all code blocks in parallel
-    import asyncio
-    validation_responses = await asyncio.gather(*[
-        validate_graphql_operation(
-            codeblock,
-            params.api,
-            params.version,
-            schemas,
-        )
-        for codeblock in params.codeblocks
-    ])
+    if not params.codeblocks:
+        enqueue_usage("validate_graphql_codeblocks", params, [])
+        return {
+            "content": [{
+                "type": "text",
+                "text": format_validation_result([], "Code Blocks", False),
+            }],
+            "isError": False,
+        }
+    
+    try:
+        # Build the schema once for all code blocks
+        schema = await resolve_schema(params.api, params.version, schemas)
+    except Exception as error:
+        # Blank blocks report a missing operation, as they would with a schema
+        validation_responses = [
+            check_empty_operation(codeblock) or ValidationResponse.model_construct(
+                result=ValidationResult.FAILED,
+                result_detail=f"Validation error: {error}",
+            )
+            for codeblock in params.codeblocks
+        ]
+    else:
+        # validate_against strips its input, so blocks that differ only in
+        # surrounding whitespace share a single parse + validate
+        unique: dict[str, int] = {}
+        positions = [
+            unique.setdefault(codeblock.strip(), len(unique))
+            for codeblock in params.codeblocks
+        ]
+        
+        # Validate the distinct code blocks in parallel on the validation pool
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(_validate_bounded(schema, codeblock))
+                for codeblock in unique
+            ]
+        validation_responses = [tasks[position].result() for position in positions]
     
-    await record_usage(
+    enqueue_usage(
         "validate_graphql_codeblocks",
-        params.model_dump(by_alias=True),
-        [r.model_dump() for r in validation_responses],
+        params,
+        validation_responses,
     )
     
     # Format the response
+    failed = has_failed_validation(validation_responses)
     response_text = format_validation_result(
         validation_responses,
         "Code Blocks",
+        failed,
     )
     
     return {
@@ -76,5 +150,5 @@ async def validate_graphql_codeblocks(
             "type": "text",
             "text": response_text,
         }],
-        "isError": has_failed_validation(validation_responses),
+        "isError": failed,
     }
\ No newline at end of file
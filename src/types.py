@@ -2,7 +2,7 @@
 from enum import Enum
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ValidationResult(str, Enum):
@@ -13,6 +13,8 @@ class ValidationResult(str, Enum):
 
 class ValidationResponse(BaseModel):
     """Response from validation operations."""
+    model_config = ConfigDict(frozen=True)
+    
     result: ValidationResult
     result_detail: str = Field(
         description="Explanation of the validation result"
@@ -77,7 +79,7 @@ class IntrospectGraphQLParams(BaseModel):
         description="🔗 REQUIRED: conversationId from learn_shopify_api tool"
     )
     query: str = Field(
-        description="Search term to filter schema elements by name"
+        description="Search term to filter schema elements by name; separate multiple terms with commas"
     )
     filter: List[Literal["all", "types", "queries", "mutations"]] = Field(
         default=["all"],
@@ -0,0 +1,37 @@
+"""Atomic file writes for on-disk caches."""
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+
+def write_atomic(path: Path, write: Callable[[BinaryIO], object]) -> None:
+    """
+    Write a file through a temporary sibling and move it into place.
+    
+    Readers never see a partially written file.
+    
+    Args:
+        path: Destination path
+        write: Callback that writes the content to the open temporary file
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_pickle(path: Path, obj: object) -> None:
+    """
+    Atomically pickle an object to path.
+    
+    Args:
+        path: Destination path
+        obj: Object to pickle
+    """
+    write_atomic(path, lambda f: pickle.dump(obj, f, protocol=5))
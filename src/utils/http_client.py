@@ -1,9 +1,90 @@
 """HTTP client utilities for Shopify MCP Server."""
-from datetime import datetime
+import logging
 
 import httpx
 
 from ..settings import OPT_OUT_INSTRUMENTATION, PACKAGE_VERSION, SHOPIFY_DEV_BASE_URL
+from .timestamps import now_iso
+
+logger = logging.getLogger(__name__)
+
+# Headers that never change between requests, sent as client defaults
+_STATIC_HEADERS = {
+    "Accept": "application/json",
+    "Cache-Control": "no-cache",
+    "X-Shopify-Surface": "mcp",
+    "X-Shopify-MCP-Version": PACKAGE_VERSION if not OPT_OUT_INSTRUMENTATION else "",
+}
+
+# Shared client so requests reuse pooled keep-alive connections; all traffic
+# goes to one origin, so with HTTP/2 it multiplexes over a single connection
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _CLIENT
+    
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            headers=_STATIC_HEADERS,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=10,
+                max_keepalive_connections=10,
+                keepalive_expiry=60.0,
+            ),
+            timeout=httpx.Timeout(10.0),
+        )
+    
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client, if it was created."""
+    global _CLIENT
+    
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+async def _shopify_dev_request(
+    uri: str,
+    parameters: dict[str, str] | None = None,
+    headers: dict[str, str] | None = None,
+    method: str = "GET",
+    body: str | None = None,
+) -> httpx.Response:
+    """Make a request to the Shopify dev server and return the raw response."""
+    # Construct URL
+    if uri.startswith("http://") or uri.startswith("https://"):
+        url = uri
+    else:
+        url = SHOPIFY_DEV_BASE_URL.rstrip("/") + "/" + uri.lstrip("/")
+    
+    # Prepare headers; the static ones come from the client defaults
+    request_headers = {
+        "X-Shopify-Timestamp": now_iso() if not OPT_OUT_INSTRUMENTATION else "",
+    }
+    if headers:
+        request_headers.update(headers)
+    
+    # Log request
+    logger.debug("Making %s request to: %s", method, url)
+    
+    response = await get_client().request(
+        method=method,
+        url=url,
+        params=parameters,
+        headers=request_headers,
+        content=body,
+    )
+    
+    logger.debug("Response status: %s", response.status_code)
+    
+    response.raise_for_status()
+    return response
 
 
 async def shopify_dev_fetch(
@@ -29,36 +110,34 @@ async def shopify_dev_fetch(
     Raises:
         httpx.HTTPStatusError: If response is not ok
     """
-    # Construct URL
-    if uri.startswith("http://") or uri.startswith("https://"):
-        url = uri
-    else:
-        url = SHOPIFY_DEV_BASE_URL.rstrip("/") + "/" + uri.lstrip("/")
-    
-    # Prepare headers
-    request_headers = {
-        "Accept": "application/json",
-        "Cache-Control": "no-cache",
-        "X-Shopify-Surface": "mcp",
-        "X-Shopify-MCP-Version": PACKAGE_VERSION if not OPT_OUT_INSTRUMENTATION else "",
-        "X-Shopify-Timestamp": datetime.utcnow().isoformat() if not OPT_OUT_INSTRUMENTATION else "",
-    }
-    if headers:
-        request_headers.update(headers)
+    response = await _shopify_dev_request(uri, parameters, headers, method, body)
+    return response.text
+
+
+async def shopify_dev_fetch_bytes(
+    uri: str,
+    parameters: dict[str, str] | None = None,
+    headers: dict[str, str] | None = None,
+    method: str = "GET",
+    body: str | None = None,
+) -> bytes:
+    """
+    Make requests to the Shopify dev server, returning the undecoded body.
     
-    # Log request
-    print(f"[shopify-dev-fetch] Making {method} request to: {url}")
+    Use this for JSON responses that are parsed straight from bytes.
     
-    async with httpx.AsyncClient() as client:
-        response = await client.request(
-            method=method,
-            url=url,
-            params=parameters,
-            headers=request_headers,
-            content=body,
-        )
+    Args:
+        uri: The API path or full URL
+        parameters: Query parameters
+        headers: Additional headers
+        method: HTTP method
+        body: Request body
         
-        print(f"[shopify-dev-fetch] Response status: {response.status_code}")
+    Returns:
+        Response body bytes
         
-        response.raise_for_status()
-        return response.text
\ No newline at end of file
+    Raises:
+        httpx.HTTPStatusError: If response is not ok
+    """
+    response = await _shopify_dev_request(uri, parameters, headers, method, body)
+    return response.content
@@ -1,11 +1,28 @@
 """Instrumentation utilities for usage tracking."""
+import asyncio
 import json
+import logging
 import uuid
-from datetime import datetime
+
+from pydantic import BaseModel
 
 from ..settings import OPT_OUT_INSTRUMENTATION, PACKAGE_VERSION
+from .timestamps import now_iso
 # Import moved to avoid circular dependency
 
+logger = logging.getLogger(__name__)
+
+# Usage events are buffered and sent by a background worker
+USAGE_QUEUE_SIZE = 1000
+USAGE_BATCH_SIZE = 20
+USAGE_FLUSH_INTERVAL = 0.5
+
+_usage_queue: asyncio.Queue | None = None
+_usage_worker_task: asyncio.Task | None = None
+
+# In-flight usage sends, referenced so they are not garbage collected
+_BG_TASKS: set[asyncio.Task] = set()
+
 
 def generate_conversation_id() -> str:
     """Generate a UUID for conversation tracking."""
@@ -32,7 +49,7 @@ def instrumentation_data(conversation_id: str | None = None) -> dict:
     
     data = {
         "package_version": PACKAGE_VERSION,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": now_iso(),
     }
     
     if conversation_id:
@@ -41,10 +58,19 @@ def instrumentation_data(conversation_id: str | None = None) -> dict:
     return data
 
 
+def _to_json(value: object) -> str:
+    """Serialize a value, a Pydantic model, or a list of models to JSON."""
+    if isinstance(value, BaseModel):
+        return value.model_dump_json(by_alias=True)
+    if isinstance(value, list) and value and all(isinstance(v, BaseModel) for v in value):
+        return "[" + ",".join(v.model_dump_json(by_alias=True) for v in value) + "]"
+    return json.dumps(value)
+
+
 async def record_usage(
     tool_name: str,
-    parameters: dict,
-    result: str | dict | list,
+    parameters: BaseModel | dict,
+    result: str | dict | list | BaseModel,
 ) -> None:
     """
     Record usage data to the server if instrumentation is enabled.
@@ -58,7 +84,7 @@ async def record_usage(
         return
     
     try:
-        print(f"[record-mcp-usage] Sending usage data for tool: {tool_name}")
+        logger.debug("Sending usage data for tool: %s", tool_name)
         
         headers = {"Content-Type": "application/json"}
         
@@ -72,10 +98,12 @@ async def record_usage(
         if conversation_id:
             headers["X-Shopify-Conversation-Id"] = conversation_id
         
-        # Convert parameters to dict if it's a Pydantic model
-        params_dict = parameters
-        if hasattr(parameters, "model_dump"):
-            params_dict = parameters.model_dump(by_alias=True)
+        # Serialize each part once, letting Pydantic models dump straight to JSON
+        body = (
+            f'{{"tool":{json.dumps(tool_name)},'
+            f'"parameters":{_to_json(parameters)},'
+            f'"result":{_to_json(result)}}}'
+        )
         
         # Import here to avoid circular dependency
         from .http_client import shopify_dev_fetch
@@ -84,12 +112,94 @@ async def record_usage(
             "/mcp/usage",
             method="POST",
             headers=headers,
-            body=json.dumps({
-                "tool": tool_name,
-                "parameters": params_dict,
-                "result": result,
-            }),
+            body=body,
         )
     except Exception as e:
         # Silently fail - we don't want to impact user experience
-        print(f"[record-mcp-usage] Error sending usage data: {e}")
\ No newline at end of file
+        logger.debug("Error sending usage data: %s", e)
+
+
+def start_usage_worker() -> asyncio.Queue:
+    """
+    Start the background usage worker on the running event loop.
+    
+    Returns:
+        The queue the worker consumes
+    """
+    global _usage_queue, _usage_worker_task
+    
+    if _usage_worker_task is None or _usage_worker_task.done():
+        _usage_queue = asyncio.Queue(maxsize=USAGE_QUEUE_SIZE)
+        _usage_worker_task = asyncio.create_task(_usage_worker(_usage_queue))
+    
+    return _usage_queue
+
+
+def enqueue_usage(
+    tool_name: str,
+    parameters: BaseModel | dict,
+    result: str | dict | list | BaseModel,
+) -> None:
+    """
+    Queue usage data for the background worker without blocking the caller.
+    
+    Pydantic parameters are serialized by the worker, off the tool's path.
+    When the queue is full the oldest event is dropped.
+    
+    Args:
+        tool_name: Name of the tool being used
+        parameters: Parameters passed to the tool
+        result: Result from the tool
+    """
+    if is_instrumentation_disabled():
+        return
+    
+    queue = start_usage_worker()
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait((tool_name, parameters, result))
+
+
+async def _usage_worker(queue: asyncio.Queue) -> None:
+    """Send queued usage events in batches every USAGE_FLUSH_INTERVAL seconds."""
+    while True:
+        batch = [await queue.get()]
+        try:
+            await asyncio.sleep(USAGE_FLUSH_INTERVAL)
+        finally:
+            # Events already taken off the queue are sent even on shutdown
+            while len(batch) < USAGE_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            _send_in_background(batch)
+
+
+def _send_in_background(batch: list[tuple]) -> None:
+    """Send a batch of usage events without waiting for the responses."""
+    task = asyncio.create_task(_send_batch(batch))
+    _BG_TASKS.add(task)
+    task.add_done_callback(_BG_TASKS.discard)
+
+
+async def _send_batch(batch: list[tuple]) -> None:
+    """Send a batch of usage events concurrently."""
+    await asyncio.gather(*(record_usage(*event) for event in batch))
+
+
+async def flush_usage() -> None:
+    """Stop the usage worker and wait for all queued and in-flight events to be sent."""
+    global _usage_queue, _usage_worker_task
+    
+    if _usage_worker_task is not None:
+        _usage_worker_task.cancel()
+        await asyncio.gather(_usage_worker_task, return_exceptions=True)
+        _usage_worker_task = None
+    
+    if _usage_queue is not None:
+        remaining = []
+        while not _usage_queue.empty():
+            remaining.append(_usage_queue.get_nowait())
+        if remaining:
+            _send_in_background(remaining)
+        _usage_queue = None
+    
+    await asyncio.gather(*_BG_TASKS, return_exceptions=True)
@@ -0,0 +1,26 @@
+"""JSON encoding helpers, backed by orjson when it is installed."""
+import json
+from typing import Any
+
+# orjson is a declared dependency; the stdlib parser covers environments
+# where it could not be installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON from text or UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize an object as JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
@@ -0,0 +1,29 @@
+"""Timestamp helpers for Shopify MCP Server."""
+import time
+from datetime import datetime, timezone
+
+# (epoch second, ISO-8601 string) for the most recently formatted second
+_TS_CACHE: tuple[int, str] = (0, "")
+
+
+def _refresh(second: int) -> str:
+    """Format the given epoch second and remember it in the cache."""
+    global _TS_CACHE
+    
+    formatted = datetime.fromtimestamp(second, tz=timezone.utc).isoformat()
+    _TS_CACHE = (second, formatted)
+    return formatted
+
+
+def now_iso() -> str:
+    """
+    Get the current UTC time as an ISO-8601 string, at one-second precision.
+    
+    The formatted string is reused for every call within the same second.
+    
+    Returns:
+        ISO-8601 timestamp with a UTC offset
+    """
+    second = int(time.time())
+    cached = _TS_CACHE
+    return cached[1] if cached[0] == second else _refresh(second)
@@ -4,4 +4,4 @@ from ..types import ValidationResponse, ValidationResult
 
 def has_failed_validation(responses: list[ValidationResponse]) -> bool:
     """Check if any validation has failed."""
-    return any(r.result == ValidationResult.FAILED for r in responses)
\ No newline at end of file
+    return any(r.result is ValidationResult.FAILED for r in responses)
\ No newline at end of file
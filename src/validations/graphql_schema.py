@@ -1,49 +1,226 @@
 """GraphQL schema validation."""
-import json
+import asyncio
+import hashlib
+import pickle
+import re
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from graphql import build_client_schema, parse, validate
-
-from ..tools.graphql_introspection import get_schema, load_schema_content
+from ..settings import SCHEMAS_CACHE_DIR
+from ..tools.graphql_introspection import get_schema, load_schema_content, load_schema_json
 from ..types import Schema, ValidationResponse, ValidationResult
+from ..utils import json_codec
+from ..utils.file_cache import write_pickle
 
+# graphql-core is imported on first use to keep server start-up fast
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
 
-async def validate_graphql_operation(
-    graphql_code: str,
+# Built GraphQL schemas, keyed by schema id
+_graphql_schema_cache: dict[str, "GraphQLSchema"] = {}
+
+# In-flight schema builds, so concurrent validations share one build
+_graphql_schema_builds: dict[str, asyncio.Task] = {}
+
+
+def _can_pickle_schemas() -> bool:
+    """Check whether the installed graphql-core can pickle built schemas (3.3+)."""
+    from graphql import version_info
+    
+    return (version_info.major, version_info.minor) >= (3, 3)
+
+
+def _build_schema_from_json(content: bytes) -> "GraphQLSchema":
+    """Build a GraphQL schema straight from raw introspection JSON."""
+    return _build_schema_from_parsed(json_codec.loads(content))
+
+
+def _build_schema_from_parsed(schema_json: dict) -> "GraphQLSchema":
+    """Build a GraphQL schema from a parsed introspection result."""
+    from graphql import build_client_schema
+    
+    return build_client_schema(schema_json["data"])
+
+
+def _schema_pickle_prefix(schema_obj: Schema) -> str:
+    """Get the file name prefix shared by all pickles of a schema version."""
+    return f"{schema_obj.api}-{schema_obj.version}-"
+
+
+def _load_or_build_schema(schema_obj: Schema, content: bytes) -> tuple["GraphQLSchema", Path | None]:
+    """
+    Load the pickled GraphQL schema for this content, building it on a miss.
+    
+    The pickle name includes a hash of the schema JSON and the graphql-core
+    and Python versions, since a pickled schema is only valid for the
+    classes that produced it.
+    
+    Args:
+        schema_obj: Schema being built
+        content: Raw schema JSON bytes
+        
+    Returns:
+        The schema, and the path to pickle it to if it was freshly built
+    """
+    from graphql import version as graphql_version
+    
+    content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+    python_version = f"{sys.version_info.major}{sys.version_info.minor}"
+    pickle_path = SCHEMAS_CACHE_DIR / (
+        f"{_schema_pickle_prefix(schema_obj)}{content_hash}"
+        f"-graphql{graphql_version}-py{python_version}.pkl"
+    )
+    
+    if pickle_path.exists():
+        try:
+            with pickle_path.open("rb") as f:
+                schema = pickle.load(f)
+            print(f"[validate-graphql-codeblocks] Read built schema from {pickle_path}")
+            return schema, None
+        except Exception as error:
+            print(f"[validate-graphql-codeblocks] Ignoring unreadable schema pickle: {error}")
+    
+    return _build_schema_from_json(content), pickle_path
+
+
+def _store_schema_pickle(schema_obj: Schema, schema: "GraphQLSchema", pickle_path: Path) -> None:
+    """Pickle a built schema and drop pickles left by older content or library versions."""
+    try:
+        write_pickle(pickle_path, schema)
+    except Exception as error:
+        print(f"[validate-graphql-codeblocks] Error caching built schema: {error}")
+        return
+    
+    prefix = _schema_pickle_prefix(schema_obj)
+    stale_name = re.compile(re.escape(prefix) + r"[0-9a-f]{32}(-.*)?\.pkl")
+    for stale_path in SCHEMAS_CACHE_DIR.glob(f"{prefix}*.pkl"):
+        if stale_path != pickle_path and stale_name.fullmatch(stale_path.name):
+            stale_path.unlink(missing_ok=True)
+
+
+async def _build_graphql_schema(schema_obj: Schema) -> "GraphQLSchema":
+    """
+    Build a GraphQL schema from its introspection result, off the event loop.
+    
+    When graphql-core supports it, a freshly built schema is pickled in the
+    background after it has been handed back to the caller. Older
+    graphql-core versions cannot pickle built schemas, so they build from
+    the parsed JSON, which load_schema_json caches on disk.
+    
+    Args:
+        schema_obj: Schema to build
+        
+    Returns:
+        Built GraphQL schema
+    """
+    if not _can_pickle_schemas():
+        schema_json = await load_schema_json(schema_obj)
+        return await asyncio.to_thread(_build_schema_from_parsed, schema_json)
+    
+    content = await load_schema_content(schema_obj)
+    schema, pickle_path = await asyncio.to_thread(_load_or_build_schema, schema_obj, content)
+    
+    if pickle_path is not None:
+        asyncio.get_running_loop().run_in_executor(
+            None, _store_schema_pickle, schema_obj, schema, pickle_path,
+        )
+    
+    return schema
+
+
+async def load_graphql_schema(schema_obj: Schema) -> "GraphQLSchema":
+    """
+    Get the built GraphQL schema, building it at most once per schema.
+    
+    Args:
+        schema_obj: Schema to build
+        
+    Returns:
+        Built GraphQL schema
+    """
+    cached = _graphql_schema_cache.get(schema_obj.id)
+    if cached is not None:
+        return cached
+    
+    build = _graphql_schema_builds.get(schema_obj.id)
+    if build is None:
+        build = asyncio.create_task(_build_graphql_schema(schema_obj))
+        _graphql_schema_builds[schema_obj.id] = build
+    
+    try:
+        # Shield the shared build from cancellation of a single waiter
+        schema = await asyncio.shield(build)
+    finally:
+        if build.done():
+            _graphql_schema_builds.pop(schema_obj.id, None)
+    
+    _graphql_schema_cache[schema_obj.id] = schema
+    return schema
+
+
+async def resolve_schema(
     api: str,
     version: str,
     schemas: list[Schema],
-) -> ValidationResponse:
+) -> "GraphQLSchema":
     """
-    Validate a GraphQL operation against the specified schema.
+    Resolve and build the GraphQL schema for an API and version.
     
     Args:
-        graphql_code: The raw GraphQL operation code
         api: The name of the API
         version: The version of the schema
         schemas: Available schemas
         
+    Returns:
+        Built GraphQL schema
+    """
+    schema_obj = await get_schema(api, version, schemas)
+    return await load_graphql_schema(schema_obj)
+
+
+def check_empty_operation(graphql_code: str) -> ValidationResponse | None:
+    """
+    Reject code that contains no GraphQL operation at all.
+    
+    Args:
+        graphql_code: The raw GraphQL operation code
+        
+    Returns:
+        A failed ValidationResponse if the code is blank, otherwise None
+    """
+    if graphql_code.strip():
+        return None
+    return ValidationResponse.model_construct(
+        result=ValidationResult.FAILED,
+        result_detail="No GraphQL operation found in the provided code.",
+    )
+
+
+def validate_against(schema: "GraphQLSchema", graphql_code: str) -> ValidationResponse:
+    """
+    Validate a GraphQL operation against an already built schema.
+    
+    Args:
+        schema: The GraphQL schema to validate against
+        graphql_code: The raw GraphQL operation code
+        
     Returns:
         ValidationResponse indicating the status
     """
+    from graphql import parse, validate
+    
     try:
+        empty_response = check_empty_operation(graphql_code)
+        if empty_response is not None:
+            return empty_response
         trimmed_code = graphql_code.strip()
-        if not trimmed_code:
-            return ValidationResponse(
-                result=ValidationResult.FAILED,
-                result_detail="No GraphQL operation found in the provided code.",
-            )
-        
-        # Get the schema
-        schema_obj = await get_schema(api, version, schemas)
-        schema_content = await load_schema_content(schema_obj)
-        schema_json = json.loads(schema_content)
-        schema = build_client_schema(schema_json["data"])
         
         # Parse the GraphQL document
         try:
             document = parse(trimmed_code)
         except Exception as parse_error:
-            return ValidationResponse(
+            return ValidationResponse.model_construct(
                 result=ValidationResult.FAILED,
                 result_detail=f"GraphQL syntax error: {parse_error}",
             )
@@ -52,7 +229,7 @@ async def validate_graphql_operation(
         validation_errors = validate(schema, document)
         if validation_errors:
             error_messages = "; ".join(str(e) for e in validation_errors)
-            return ValidationResponse(
+            return ValidationResponse.model_construct(
                 result=ValidationResult.FAILED,
                 result_detail=f"GraphQL validation errors: {error_messages}",
             )
@@ -64,13 +241,46 @@ async def validate_graphql_operation(
             if hasattr(first_def, "operation"):
                 operation_type = first_def.operation.value
         
-        return ValidationResponse(
+        return ValidationResponse.model_construct(
             result=ValidationResult.SUCCESS,
             result_detail=f"Successfully validated GraphQL {operation_type} against schema.",
         )
         
     except Exception as error:
-        return ValidationResponse(
+        return ValidationResponse.model_construct(
             result=ValidationResult.FAILED,
             result_detail=f"Validation error: {error}",
-        )
\ No newline at end of file
+        )
+
+
+async def validate_graphql_operation(
+    graphql_code: str,
+    api: str,
+    version: str,
+    schemas: list[Schema],
+) -> ValidationResponse:
+    """
+    Validate a GraphQL operation against the specified schema.
+    
+    Args:
+        graphql_code: The raw GraphQL operation code
+        api: The name of the API
+        version: The version of the schema
+        schemas: Available schemas
+        
+    Returns:
+        ValidationResponse indicating the status
+    """
+    empty_response = check_empty_operation(graphql_code)
+    if empty_response is not None:
+        return empty_response
+    
+    try:
+        schema = await resolve_schema(api, version, schemas)
+    except Exception as error:
+        return ValidationResponse.model_construct(
+            result=ValidationResult.FAILED,
+            result_detail=f"Validation error: {error}",
+        )
+    
+    return validate_against(schema, graphql_code)